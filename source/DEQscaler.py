@@ -7,9 +7,167 @@ Tool to rescale systems of ordinary differential equations of the type dy /dt =
 4. The absolut maximum values of the numerical solution are used to rescale the problem to the domain [-1,1] (analog computer implementation).
 """
 
+import functools
+from collections import namedtuple
+
 import numpy as np
 import sympy
-from scipy import integrate
+from scipy import LowLevelCallable, integrate
+
+"""
+numba is an optional dependency: if it is available the lambdified f(t,y) is compiled to machine code, otherwise the plain lambdified function is used.
+"""
+try:
+    import numba
+except ImportError:
+    numba = None
+
+"""
+Minimal solution container mimicking the scipy.integrate.solve_ivp result for the alternative solver backends, so determine_max works unchanged.
+"""
+_NumSolution = namedtuple('_NumSolution', ['t', 'y'])
+
+"""
+Fused single-pass reduction of the absolut row maxima of a trajectory array, parallelized over the equations.
+With numba the absolute value and the maximum are computed in one traversal without the intermediate array numpy's absolute().max(axis=1) allocates; otherwise the numpy reduction is used.
+"""
+if numba is not None:
+    @numba.njit(parallel=True)
+    def _row_absmax(trajectories):
+        """
+        [No fastmath here: it would make the NaN comparisons undefined and buys nothing on a compare-only reduction.]
+        A NaN from a diverged or failed solve must propagate into the maximum like in the numpy reduction, instead of yielding a plausible finite value; the explicit value != value check keeps it latched.
+        """
+        row_maxima = np.empty(trajectories.shape[0], trajectories.dtype)
+        for row in numba.prange(trajectories.shape[0]):
+            maximum = abs(trajectories[row, 0])
+            for col in range(1, trajectories.shape[1]):
+                value = abs(trajectories[row, col])
+                if value > maximum or value != value:
+                    maximum = value
+            row_maxima[row] = maximum
+        return row_maxima
+else:
+    def _row_absmax(trajectories):
+        return np.absolute(trajectories).max(axis=1)
+
+"""
+Creating the numeric functions [the lambdify and in particular the numba compilation] is by far the most expensive part of setting up a system.
+When the rescaling is iterated the same expression vectors reappear, so the created callables are memoized at module level.
+The cache keys are the substituted sympy expressions and the calculation variables, which are both hashable.
+"""
+@functools.lru_cache(maxsize=32)
+def _make_f_vec(expr_tuple, calc_variables):
+    """
+    Return the plain lambdified vector function and [if numba is available] its njit-wrapped counterpart, else None.
+    The compilation itself only happens at the first call of the jitted function.
+    """
+    f_vec = sympy.lambdify(calc_variables, sympy.Matrix(expr_tuple), modules=['math', 'numpy'], cse=True)
+    if numba is not None:
+        """
+        Declare the concrete float64 signature up front: numba then compiles eagerly and LLVM can auto-vectorize, instead of specializing lazily at the first call.
+        If the generated code cannot be compiled with this signature the plain lambdified function is the only one returned.
+        """
+        f_vec_signature = numba.float64[:, :](*([numba.float64] * len(calc_variables)))
+        try:
+            return f_vec, numba.njit(f_vec_signature, fastmath=True)(f_vec)
+        except Exception:
+            pass
+    return f_vec, None
+
+@functools.lru_cache(maxsize=32)
+def _make_out_f_vec(expr_tuple, calc_variables):
+    """
+    Generate the right hand side as a function writing into a caller supplied output array.
+    lambdify cannot emit an out parameter, so the source is generated directly [with common subexpression elimination, like lambdify does internally].
+    The resulting function allocates nothing per call; with numba it is compiled in-place with a void signature.
+    """
+    from sympy.printing.numpy import NumPyPrinter
+
+    printer = NumPyPrinter()
+    """The cse symbols and the helper arguments are underscore-prefixed so they cannot collide with the user's symbols."""
+    replacements, reduced = sympy.cse(list(expr_tuple), symbols=sympy.numbered_symbols('_cse'))
+
+    source_lines = ['def _num_rhs({:}, _state, _out):'.format(calc_variables[0])]
+    for pos, ele in enumerate(calc_variables[1:]):
+        source_lines.append('    {:} = _state[{:}]'.format(ele, pos))
+    for symbol, subexpression in replacements:
+        source_lines.append('    {:} = {:}'.format(symbol, printer.doprint(subexpression)))
+    for pos, ele in enumerate(reduced):
+        source_lines.append('    _out[{:}] = {:}'.format(pos, printer.doprint(ele)))
+
+    namespace = {'numpy': np}
+    exec('\n'.join(source_lines), namespace)
+    out_f_vec = namespace['_num_rhs']
+
+    if numba is not None:
+        out_signature = numba.types.void(numba.float64, numba.float64[:], numba.float64[:])
+        try:
+            return numba.njit(out_signature, fastmath=True)(out_f_vec)
+        except Exception:
+            pass
+    return out_f_vec
+
+@functools.lru_cache(maxsize=32)
+def _make_array_f_vec(expr_tuple, calc_variables):
+    """
+    Return an njit-compiled right hand side f(t, state) taking the state as one array, as required e.g. by the nbkode solvers.
+    """
+    core = numba.njit(fastmath=True)(
+        sympy.lambdify([calc_variables], sympy.Matrix(expr_tuple), modules='numpy', cse=True))
+    n_eqns = len(calc_variables) - 1
+
+    @numba.njit(fastmath=True)
+    def array_f_vec(t, state):
+        var_step_vals = np.empty(n_eqns + 1)
+        var_step_vals[0] = t
+        for pos in range(n_eqns):
+            var_step_vals[pos + 1] = state[pos]
+        return core(var_step_vals).ravel()
+
+    return array_f_vec
+
+@functools.lru_cache(maxsize=32)
+def _make_autowrap_f_vec(expr_tuple, calc_variables):
+    """
+    Return the right hand side as a compiled C extension created by sympy.utilities.autowrap with the cython backend.
+    This skips the Python layer of the lambdify-generated code entirely; it requires cython and a C compiler.
+    """
+    from sympy.utilities.autowrap import autowrap
+    return autowrap(sympy.Matrix(expr_tuple), backend='cython', args=calc_variables)
+
+@functools.lru_cache(maxsize=32)
+def _make_jac_vec(expr_tuple, calc_variables):
+    """
+    Return the lambdified Jacobian df/dy of the substituted expression vector. The variables y are all calc_variables except the leading t.
+    """
+    jac_expr = sympy.Matrix(expr_tuple).jacobian(calc_variables[1:])
+    return sympy.lambdify(calc_variables, jac_expr, modules='numpy', cse=True)
+
+@functools.lru_cache(maxsize=32)
+def _make_rhs_callback(expr_tuple, calc_variables):
+    """
+    Return a numba.cfunc C callback for the right hand side with the common void(t, y*, dy*, p*) signature.
+    """
+    array_f_vec = numba.njit(fastmath=True)(
+        sympy.lambdify([calc_variables], sympy.Matrix(expr_tuple), modules='numpy', cse=True))
+    n_eqns = len(calc_variables) - 1
+    double_ptr = numba.types.CPointer(numba.types.double)
+    rhs_signature = numba.types.void(numba.types.double, double_ptr, double_ptr, double_ptr)
+
+    @numba.cfunc(rhs_signature)
+    def rhs_callback(t, state_ptr, deriv_ptr, data_ptr):
+        var_step_vals = np.empty(n_eqns + 1)
+        var_step_vals[0] = t
+        state = numba.carray(state_ptr, (n_eqns,))
+        deriv = numba.carray(deriv_ptr, (n_eqns,))
+        for pos in range(n_eqns):
+            var_step_vals[pos + 1] = state[pos]
+        result = array_f_vec(var_step_vals)
+        for pos in range(n_eqns):
+            deriv[pos] = result[pos, 0]
+
+    return rhs_callback
 
 """
 A class to represent and rescale a system of ordinary differential equations of the type dy/dt = f(t,y) with initial conditions y(t0)=y0 and parameters.
@@ -35,10 +193,29 @@ class DEQscaler:
         self.max_scale_factor = max_scale_factor
         self.kwargs_solve_ivp = kwargs_solve_ivp
 
-        self.num_f_t_y = []
         self.num_sol = []
         self.maxima = {}
 
+        """
+        Build the parameter substitution dictionary for .xreplace() once.
+        Wrapping the values in sympy.Float keeps sympy from retaining exact Rationals [whose giant integer numerators choke the numeric code generation downstream].
+        """
+        self._param_xrepl = {symbol: sympy.Float(value) for symbol, value in self.diff_eq_parameters.items()}
+
+        """
+        Build the tuple of the variables used by the numeric functions once as well; it also serves as part of the memoization keys.
+        """
+        self._calc_variables = tuple([self.t] + self.dydt)
+
+        self._expr_f_t_y = None
+        self._f_vec = None
+        self._out_f_vec = None
+        self._out = None
+        self._jac_vec = None
+        self._running_max = None
+        self._rhs_callback = None
+        self._low_level_rhs = None
+
     """
     Display the properties of the created object as text in the console.
     """
@@ -68,81 +245,339 @@ class DEQscaler:
         print("")
 
         print("System of Equations (for numerical calculation):")
-        """Create tuple to substitute parameters with their values."""
-        substitution_parameters = [(ele[0], ele[1]) for ele in self.diff_eq_parameters.items()]
-        """Use the substitution to display the numerical values."""
+        """Use the substituted expression vector to display the numerical values."""
+        expr_vec = self.substitute_parameters()
         for pos, ele in enumerate(self.dydt):
-            print("{:} = {:}".format(str(ele), str(self.f_t_y[pos].subs(substitution_parameters))))
+            print("{:} = {:}".format(str(ele), str(expr_vec[pos])))
+
+    """
+    Substitute the parameters with their numeric values in all equations at once.
+    The whole system is handled as a single sympy.Matrix so the expression trees are only walked once.
+    The .xreplace() is used instead of .subs() since the former is a plain symbol lookup without pattern matching and hence much faster.
+    The result is cached so repeated calls (e.g. show_eqn followed by create_num_f_t_y) do not repeat the substitution.
+    """
+    def substitute_parameters(self):
+        if self._expr_f_t_y is None:
+            self._expr_f_t_y = sympy.Matrix(self.f_t_y).xreplace(self._param_xrepl)
+        return self._expr_f_t_y
 
     """
-    Use sympy.lambdify to create numeric scipy functions with substituted values for the parameters.
+    Use sympy.lambdify to create one numeric function for the whole system with substituted values for the parameters.
     """
-    def create_num_f_t_y(self):
+    def create_num_f_t_y(self, backend='lambdify'):
+
+        """
+        The tuple of the variables used to solve later on [cached in __init__].
+        """
+        calc_variables = self._calc_variables
+
+        """
+        Substitute the parameters with their numeric values in one pass over the whole system.
+        Use the tuple calc_variables to specify on which variables the numeric function depends.
+        The whole vector is lambdified as a single function with cse=True so common subexpressions shared between the equations are only evaluated once per call.
+        Since solve_ivp evaluates f(t,y) with scalars the math module is preferred over numpy for the elementary functions [scalar math calls are much cheaper than numpy ufuncs on 0-d input]; numpy is still needed to build the result vector.
+        """
+        expr_tuple = tuple(self.substitute_parameters())
+
+        """
+        With backend='autowrap' the right hand side is emitted as a compiled C extension [cf. _make_autowrap_f_vec].
+        If cython or a C compiler is not available the default lambdify path below is used instead.
+        """
+        self._f_vec = None
+        use_autowrap = False
+        if backend == 'autowrap':
+            try:
+                self._f_vec = _make_autowrap_f_vec(expr_tuple, calc_variables)
+                use_autowrap = True
+            except Exception:
+                self._f_vec = None
+
+        if self._f_vec is None:
+            plain_f_vec, jitted_f_vec = _make_f_vec(expr_tuple, calc_variables)
+            self._f_vec = plain_f_vec
+        else:
+            jitted_f_vec = None
+
+        """
+        If numba is available use the machine code compiled variant.
+        [Note cache=True may not be passed to njit since the lambdify-generated source has no file to cache against; the module level memoization takes its place.]
+        A trial evaluation with the initial values forces the compilation; if numba cannot handle the generated code the plain lambdified function is kept.
+        """
+        if jitted_f_vec is not None:
+            try:
+                jitted_f_vec(float(self.args_solve_ivp_ini_val[0][0]),
+                             *[float(ele) for ele in self.args_solve_ivp_ini_val[1]])
+                self._f_vec = jitted_f_vec
+            except Exception:
+                pass
 
         """
-        Create tuple of the variables used to solve later on.
+        Additionally create the in-place variant of the right hand side together with a template for its output arrays [cf. _make_out_f_vec].
+        It is preferred by derivative since it writes the result directly instead of building it from the lambdify return value.
+        [Not when the autowrap backend succeeded: the preference for the in-place variant would silently bypass the compiled C extension.]
         """
-        calc_variables = tuple([self.t] + self.dydt)
+        self._out_f_vec = None
+        if not use_autowrap:
+            try:
+                self._out_f_vec = _make_out_f_vec(expr_tuple, calc_variables)
+                self._out = np.empty(len(self.dydt))
+            except Exception:
+                self._out_f_vec = None
 
         """
-        Iterate over the f(t,y) functions, i.e. proceed elementwise.
-        For every function use the .subs() to replace the parameters with their numeric values.        
-        Use the tuple calc_variables to specify on which variables the numeric functions depend.        
-        Ensure a scipy object is created using the modules kwarg.
+        Since f(t,y) is available symbolically the Jacobian df/dy can be computed exactly instead of being approximated by finite differences inside the implicit solvers.
         """
-        self.num_f_t_y = [
-            sympy.lambdify([calc_variables], ele.subs(self.diff_eq_parameters), modules=["scipy", "numpy"]) for ele in
-            self.f_t_y]
+        self._jac_vec = _make_jac_vec(expr_tuple, calc_variables)
 
     """
     The scipy.integrate.solve_ivp requires a callable f(t,y) function fun.
-    This is implemented here using the num_f_t_y.
+    This is implemented here using the lambdified vector function.
     """
     def derivative(self, t, state):
         """
-        Create List of step values including t. [The t might not be used according to the specific equation, but is required for solve_ivp.]
+        Evaluate the numeric vector function with the step values.
+        [The t might not be used according to the specific equation, but is required for solve_ivp.]
+        The state may be any sequence; it is coerced to a float array since the compiled in-place variant only accepts ndarrays.
+        The in-place variant writes into a fresh output array passed from here.
+        [A single shared buffer must not be returned: the Runge-Kutta solvers keep a reference to the returned array across steps, which the next evaluation would silently overwrite.]
         """
-        var_step_vals = np.concatenate(([t], state))
+        state = np.asarray(state, dtype=float)
 
-        """
-        Evaluate num_f_ty using the step values.
-        """
-        calc_eqns = [ele(var_step_vals) for ele in self.num_f_t_y]
+        if self._out_f_vec is not None:
+            out = np.empty_like(self._out)
+            self._out_f_vec(t, state, out)
+            return out
+
+        return np.asarray(self._f_vec(t, *state)).ravel()
+
+    """
+    Evaluate the exact Jacobian df/dy at (t, state). Used by the implicit solve_ivp methods.
+    """
+    def jacobian(self, t, state):
+        return np.asarray(self._jac_vec(t, *state))
+
+    """
+    The right hand side as C-level callback wrapped in a scipy.LowLevelCallable.
+    Note scipy.integrate.solve_ivp only accepts Python callables, so the callback is not used by solve_numerically.
+    It is provided for integrators accepting C function pointers [e.g. numbalsoda, whose rhs signature void(t, y*, dy*, p*) is used here] and hence only compiled on first access.
+    Returns None if numba is unavailable or the callback cannot be compiled.
+    """
+    @property
+    def low_level_rhs(self):
+        if self._low_level_rhs is None and numba is not None:
+            try:
+                """Keep a reference to the cfunc so the compiled code is not garbage collected while the wrapper lives."""
+                self._rhs_callback = _make_rhs_callback(tuple(self.substitute_parameters()), self._calc_variables)
+                self._low_level_rhs = LowLevelCallable(self._rhs_callback.ctypes)
+            except Exception:
+                self._low_level_rhs = None
+        return self._low_level_rhs
+
+    """
+    Solve the system with DifferentialEquations.jl through diffeqpy [requires the optional diffeqpy dependency and a Julia installation].
+    The Julia problem is specialized with de.jit before solving, which is particularly worthwhile for stiff systems.
+    The rtol/atol entries of kwargs_solve_ivp are translated to their Julia counterparts; the result is wrapped so determine_max works unchanged.
+    """
+    def solve_with_julia(self):
+        from diffeqpy import de
+
+        f_vec = self._f_vec
+
+        """DifferentialEquations.jl expects the right hand side in the form f(u, p, t)."""
+        def julia_rhs(state, p, t):
+            return np.asarray(f_vec(t, *state)).ravel()
 
-        return calc_eqns
+        problem = de.ODEProblem(julia_rhs,
+                                np.asarray(self.args_solve_ivp_ini_val[1], dtype=float),
+                                tuple(self.args_solve_ivp_ini_val[0]))
+
+        """Specialize the problem with de.jit; if the symbolic tracing fails solve the plain problem."""
+        try:
+            problem = de.jit(problem)
+        except Exception:
+            pass
+
+        kwargs_julia = {}
+        if 'rtol' in self.kwargs_solve_ivp:
+            kwargs_julia['reltol'] = self.kwargs_solve_ivp['rtol']
+        if 'atol' in self.kwargs_solve_ivp:
+            kwargs_julia['abstol'] = self.kwargs_solve_ivp['atol']
+
+        solution = de.solve(problem, **kwargs_julia)
+
+        return _NumSolution(t=np.asarray(solution.t), y=np.asarray(solution.u).T)
+
+    """
+    Solve the system with the numba-compiled DOP853 from nbkode [optional dependency numbakit-ode], requested via kwargs_solve_ivp={'method': 'dop853_numba'}.
+    The whole integration loop then runs as machine code without a Python callback per step, which pays off when the rescaling is iterated.
+    The rtol/atol/t_eval entries of kwargs_solve_ivp are honoured; the other solve_ivp kwargs do not apply to nbkode.
+    """
+    def solve_with_nbkode(self):
+        import nbkode
+
+        array_f_vec = _make_array_f_vec(tuple(self.substitute_parameters()), self._calc_variables)
+
+        t_span = self.args_solve_ivp_ini_val[0]
+        y0 = np.asarray(self.args_solve_ivp_ini_val[1], dtype=float)
+
+        kwargs_nbkode = {key: self.kwargs_solve_ivp[key] for key in ('rtol', 'atol') if key in self.kwargs_solve_ivp}
+        solver = nbkode.DOP853(array_f_vec, t_span[0], y0, **kwargs_nbkode)
+
+        """Evaluate on a fixed grid [nbkode interpolates from its internal adaptive steps]."""
+        t_eval = self.kwargs_solve_ivp.get('t_eval')
+        if t_eval is None:
+            t_eval = np.linspace(t_span[0], t_span[1], 1000)
+        time_steps, states = solver.run(t_eval)
+
+        return _NumSolution(t=np.asarray(time_steps), y=np.asarray(states).T)
 
     """
     Perform the numeric integration to solve the system using the args and potential kwargs specified.
+    Besides the default backend='lambdify' there are 'autowrap' [C-compiled right hand side, cf. create_num_f_t_y] and 'julia' [integrate with DifferentialEquations.jl instead of solve_ivp].
+    With track_running_max=True the absolut maxima are accumulated on the fly in self._running_max during the scipy integration and only the endpoints of the trajectory are stored, so the memory use drops from O(steps*N) to O(N).
     """
-    def solve_numerically(self):
+    def solve_numerically(self, backend='lambdify', track_running_max=False):
         """
         Create the lambdify numeric functions to be used
         """
-        self.create_num_f_t_y()
+        self.create_num_f_t_y(backend=backend if backend != 'julia' else 'lambdify')
+
+        """
+        The alternative backends retain their full [sampled] trajectory anyway, so the running maxima are derived from it afterwards and streaming gives no memory advantage there.
+        [Without this self._running_max would stay uninitialized on these branches and determine_max(streaming=True) would fail.]
+        """
+        if backend == 'julia':
+            self.num_sol = self.solve_with_julia()
+            if track_running_max:
+                self._running_max = np.absolute(self.num_sol.y).max(axis=1)
+            return
+
+        """
+        The pseudo method 'dop853_numba' routes the integration through the numba-compiled DOP853 of nbkode.
+        """
+        if self.kwargs_solve_ivp.get('method') == 'dop853_numba':
+            self.num_sol = self.solve_with_nbkode()
+            if track_running_max:
+                self._running_max = np.absolute(self.num_sol.y).max(axis=1)
+            return
+
+        """
+        For the implicit methods pass the exact Jacobian [unless the user provided one], saving the N+1 additional f(t,y) evaluations per finite-difference Jacobian.
+        """
+        kwargs_solve_ivp = dict(self.kwargs_solve_ivp)
+        if kwargs_solve_ivp.get('method') in ('BDF', 'Radau', 'LSODA') and 'jac' not in kwargs_solve_ivp:
+            kwargs_solve_ivp['jac'] = self.jacobian
+
+        """
+        Bind the raw numeric callable in a local closure, so the hot path avoids the bound method call and the attribute lookups on self that solve_ivp would otherwise perform on every step.
+        [An args= tuple is not needed: the parameter values are already baked into the compiled right hand side.]
+        """
+        out_f_vec = self._out_f_vec
+        if out_f_vec is not None:
+            out_template = self._out
+
+            def rhs(t, state):
+                out = np.empty_like(out_template)
+                out_f_vec(t, state, out)
+                return out
+        else:
+            f_vec = self._f_vec
+
+            def rhs(t, state):
+                return np.asarray(f_vec(t, *state)).ravel()
+
+        """
+        When tracking the running maxima wrap the right hand side so every evaluated state updates the accumulator, and restrict the stored output to the interval endpoints [unless the user asked for specific evaluation times].
+        [The right hand side is also evaluated at trial states of rejected steps, so the running maxima can slightly overestimate the trajectory maxima - which errs on the safe side for the rescaling.]
+        """
+        if track_running_max:
+            self._running_max = np.absolute(np.asarray(self.args_solve_ivp_ini_val[1], dtype=float))
+            kwargs_solve_ivp.setdefault('t_eval', np.asarray(self.args_solve_ivp_ini_val[0], dtype=float))
+
+            running_max = self._running_max
+            plain_rhs = rhs
+
+            def rhs(t, state):
+                np.maximum(running_max, np.absolute(state), out=running_max)
+                return plain_rhs(t, state)
 
         """
         Use the scipy.integrate.solve_ivp function.
         """
-        self.num_sol = integrate.solve_ivp(self.derivative, *self.args_solve_ivp_ini_val, **self.kwargs_solve_ivp)
+        self.num_sol = integrate.solve_ivp(rhs, *self.args_solve_ivp_ini_val, **kwargs_solve_ivp)
 
     """
     Determine the absolut maxima of the trajectories using the numerical solution.
+    dtype: Optional numpy dtype [e.g. np.float32] the solution is cast to before the reduction.
+           The integration itself stays in double precision; since the rescaling only needs the maxima to about 3 significant figures, single precision halves the memory traffic of this memory-bound pass.
+    streaming: With True the maxima are accumulated during the integration and the full trajectory is never retained [cf. solve_numerically], keeping the memory use independent of the number of steps.
     """
-    def determine_max(self):
+    def determine_max(self, dtype=None, streaming=False):
+        if streaming:
+            self.solve_numerically(track_running_max=True)
+            maxima_values = self._running_max
+            if dtype is not None:
+                maxima_values = np.asarray(maxima_values, dtype=dtype)
+            self.maxima = dict(zip(self.dydt, maxima_values))
+            return
+
         """
         Calculate the numerical solution.
         """
         self.solve_numerically()
 
+        trajectories = self.num_sol.y
+        if dtype is not None:
+            trajectories = np.asarray(trajectories, dtype=dtype)
+
         """
-        Determine the absolut maxima.
+        Determine the absolut maxima of all trajectories in one fused reduction [cf. _row_absmax].
+        The solution array is reduced as returned by the solver: sol.y is the transpose of the step-major storage, so the kernel reads each equation row strided rather than paying a full contiguous copy of the trajectory first.
         Potential adaption: Use the numpy ceiling function np.ceil to round to 3 significant figures.
-        by replacint "np.absolute(ele).max()" with "np.ceil(np.absolute(ele).max()*1000)/1000"
+        by replacing "_row_absmax(trajectories)" with "np.ceil(_row_absmax(trajectories)*1000)/1000"
         """
-        self.maxima = {self.dydt[pos]: np.absolute(ele).max() for pos, ele in enumerate(self.num_sol.y)}
+        self.maxima = dict(zip(self.dydt, _row_absmax(trajectories)))
 
     """
-    Create arguments to instanciate the new, rescaled DEQ system 
+    Determine the absolut maxima for a batch of systems sharing the same symbolic f(t,y), as they occur in parameter studies.
+    y0_array:       Optional list of initial value vectors, one entry per run [default: the instance initial values for every run].
+    parameter_sets: Optional list of parameter dictionaries, one entry per run [default: the instance parameters for every run].
+    A single entry in either argument is repeated to match the length of the other.
+    The compiled right hand sides are shared through the module level memoization, so every distinct parameter set is only lambdified and compiled once for the whole sweep.
+    Returns an ndarray of shape (number of runs, number of equations) with the absolut maxima, ordered as self.dydt.
+    """
+    def determine_max_batch(self, y0_array=None, parameter_sets=None):
+        if y0_array is None:
+            y0_array = [self.args_solve_ivp_ini_val[1]]
+        if parameter_sets is None:
+            parameter_sets = [self.diff_eq_parameters]
+
+        """
+        Broadcast a single initial value vector or parameter set over the other argument.
+        """
+        if len(y0_array) == 1 and len(parameter_sets) > 1:
+            y0_array = list(y0_array) * len(parameter_sets)
+        elif len(parameter_sets) == 1 and len(y0_array) > 1:
+            parameter_sets = list(parameter_sets) * len(y0_array)
+
+        """
+        After the broadcasting the lengths have to agree, otherwise the fill loop below would truncate to the shorter list and leave uninitialized rows in the result.
+        """
+        if len(y0_array) != len(parameter_sets):
+            raise ValueError("y0_array and parameter_sets must have the same length, got {:} and {:}".format(
+                len(y0_array), len(parameter_sets)))
+
+        batch_maxima = np.empty((len(y0_array), len(self.dydt)))
+        for pos, (y0, parameters) in enumerate(zip(y0_array, parameter_sets)):
+            scaler = DEQscaler([self.args_solve_ivp_ini_val[0], list(y0)], self.t, self.dydt, self.f_t_y,
+                               parameters, self.max_scale_factor, self.kwargs_solve_ivp)
+            scaler.determine_max()
+            batch_maxima[pos] = [scaler.maxima[ele] for ele in self.dydt]
+
+        return batch_maxima
+
+    """
+    Create arguments to instanciate the new, rescaled DEQ system
     """
     def create_rescaled_Diff_Eq(self, maxima_items=None):
         """
@@ -163,27 +598,24 @@ class DEQscaler:
         round_up_maxima = {key: value * self.max_scale_factor for key, value in maxima_items}
 
         """
-        Rescale the initial values, i.e. y0 in the args_solve_ivp_ini_val
+        Rescale the initial values, i.e. y0 in the args_solve_ivp_ini_val, with one vectorized divide.
         """
+        maxima_vector = np.array([round_up_maxima[ele] for ele in self.dydt], dtype=float)
         rescaled_args_solve_ivp_ini_val = [self.args_solve_ivp_ini_val[0],
-                                           [self.args_solve_ivp_ini_val[1][pos] * 1 / round_up_maxima[ele] for pos, ele
-                                            in enumerate(self.dydt)]]
-
-        """
-        Create the tuples used to substitute the symbolic variables with the product of the rescaling factor and the symbolic variable.
-        """
-        substitution_list_tuples = [(ele[0], ele[0] * ele[1]) for ele in round_up_maxima.items()]
+                                           (np.asarray(self.args_solve_ivp_ini_val[1], dtype=float)
+                                            / maxima_vector).tolist()]
 
         """
-        Create the factor list used to scale each expression in f_t_y as a whole.
+        Create the mapping used to substitute the symbolic variables with the product of the rescaling factor and the symbolic variable.
         """
-        rescale_eqns_factors = [1 / ele[1] for ele in round_up_maxima.items()]
+        scale_map = {variable: maximum * variable for variable, maximum in round_up_maxima.items()}
 
         """
         Create the rescaled equation rescaled_f_t_y.
+        The whole system is substituted in one .xreplace() pass over a sympy.Matrix and scaled elementwise with the inverse maxima, instead of N separate .subs() calls.
         """
-        rescaled_f_t_y = [rescale_eqns_factors[pos] * ele.subs(substitution_list_tuples) for pos, ele in
-                          enumerate(self.f_t_y)]
+        inverse_maxima = sympy.Matrix([1 / round_up_maxima[ele] for ele in self.dydt])
+        rescaled_f_t_y = list(sympy.Matrix(self.f_t_y).xreplace(scale_map).multiply_elementwise(inverse_maxima))
 
         return [rescaled_args_solve_ivp_ini_val, self.t, self.dydt, rescaled_f_t_y, self.diff_eq_parameters,
                 self.max_scale_factor, self.kwargs_solve_ivp]